@@ -1,13 +1,119 @@
-import unittest
-from decimal import Decimal, getcontext
+import math
 import numpy as np
 from numpy import exp, sqrt, log
-from scipy.stats import norm
+from scipy.special import ndtr
 
-# Set NumPy print precision
-np.set_printoptions(precision=10, suppress=True)
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# 1 / sqrt(2*pi), used for the standard normal pdf in the gamma calculation
+_INV_SQRT_2PI = 0.3989422804014327
+# 1 / sqrt(2), used to express the normal cdf through erfc
+_SQRT1_2 = 0.7071067811865476
+
+
+if njit is not None:
+    @njit(inline='always')
+    def _phi(x):
+        # Standard normal cdf: Phi(x) = 0.5 * erfc(-x / sqrt(2)).
+        # math.erfc works in nopython mode and inlines into the kernel loop.
+        return 0.5 * math.erfc(-x * _SQRT1_2)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _bs_grid_njit(spot, vol, K, T, r):
+        nvol = vol.shape[0]
+        nspot = spot.shape[0]
+        call_grid = np.empty((nvol, nspot), dtype=np.float32)
+        put_grid = np.empty((nvol, nspot), dtype=np.float32)
+        sqrt_T = math.sqrt(T)
+        disc = math.exp(-r * T)
+        for i in prange(nvol):
+            sig = vol[i]
+            sig_sqrt_T = sig * sqrt_T
+            for j in range(nspot):
+                S = spot[j]
+                d1 = (math.log(S / K) + (r + 0.5 * sig * sig) * T) / sig_sqrt_T
+                d2 = d1 - sig_sqrt_T
+                # Phi(-x) = 1 - Phi(x), so two cdf evaluations cover both legs
+                n1 = _phi(d1)
+                n2 = _phi(d2)
+                call_grid[i, j] = S * n1 - K * disc * n2
+                put_grid[i, j] = K * disc * (1.0 - n2) - S * (1.0 - n1)
+        return call_grid, put_grid
+
+    # Warm up once at import so the first heatmap render does not pay the
+    # JIT compile (cache=True keeps it fast across processes).
+    _bs_grid_njit(np.array([100.0]), np.array([0.2]), 100.0, 1.0, 0.05)
+
+
+def bs_price(S, K, T, r, sigma):
+    """Price a single call/put pair without building a BlackScholes object.
+
+    Lightweight counterpart to bs_price_grid for one-off evaluations:
+    no instance dict, no PnL/greeks bookkeeping. Returns (call, put).
+    """
+    sqrt_T = sqrt(T)
+    sig_sqrt_T = sigma * sqrt_T
+    d1 = (log(S / K) + (r + 0.5 * sigma * sigma) * T) / sig_sqrt_T
+    d2 = d1 - sig_sqrt_T
+    disc = exp(-r * T)
+    N1 = ndtr(d1)
+    N2 = ndtr(d2)
+    return S * N1 - K * disc * N2, K * disc * (1.0 - N2) - S * (1.0 - N1)
+
+
+def bs_price_grid(strike, time_to_maturity, interest_rate, vol_range, spot_range):
+    """Price calls and puts over a (volatility, spot) grid in one shot.
+
+    Dispatches to a parallel Numba kernel when numba is installed, and
+    otherwise broadcasts the Black-Scholes formula over the full grid
+    with NumPy array operations. Grids are float32: the heatmap displays
+    two decimal places, so single precision is plenty and halves memory
+    traffic. Returns (call_grid, put_grid), each shaped
+    (len(vol_range), len(spot_range)).
+    """
+    if njit is not None:
+        return _bs_grid_njit(
+            np.ascontiguousarray(spot_range, dtype=np.float64),
+            np.ascontiguousarray(vol_range, dtype=np.float64),
+            float(strike), float(time_to_maturity), float(interest_rate)
+        )
+
+    S = np.asarray(spot_range, dtype=np.float32)[None, :]
+    sig = np.asarray(vol_range, dtype=np.float32)[:, None]
+    K = float(strike)
+    T = float(time_to_maturity)
+    r = float(interest_rate)
+
+    # Python-float scalars keep the float32 arrays from promoting to float64
+    sqrt_T = math.sqrt(T)
+    disc = math.exp(-r * T)
+
+    d1 = (np.log(S / K) + (r + 0.5 * sig * sig) * T) / (sig * sqrt_T)
+    d2 = d1 - sig * sqrt_T
+
+    # ndtr is a ufunc: one call processes the whole 2D grid in C (SIMD
+    # where scipy's build supports it), so keep the arrays intact rather
+    # than looping or flattening
+    N1 = ndtr(d1)
+    N2 = ndtr(d2)
+    call_grid = S * N1 - K * disc * N2
+    put_grid = K * disc * (1.0 - N2) - S * (1.0 - N1)
+    return call_grid, put_grid
 
 class BlackScholes:
+    __slots__ = (
+        'time_to_maturity', 'strike', 'current_price', 'volatility',
+        'interest_rate', 'call_purchase_price', 'put_purchase_price',
+        'purchase_time_to_maturity', 'call_price', 'put_price',
+        'call_pnl', 'call_pnl_percentage', 'put_pnl', 'put_pnl_percentage',
+        'call_delta', 'put_delta', 'gamma',
+        'max_call_loss', 'max_put_loss', 'max_call_gain', 'max_put_gain',
+        'call_breakeven', 'put_breakeven'
+    )
+
     def __init__(
         self,
         time_to_maturity: float,
@@ -19,92 +125,92 @@ class BlackScholes:
         put_purchase_price: float = None,
         purchase_time_to_maturity: float = None
     ):
-        # Convert inputs to high precision
-        self.time_to_maturity = float(np.format_float_positional(time_to_maturity, precision=10))
-        self.strike = float(np.format_float_positional(strike, precision=10))
-        self.current_price = float(np.format_float_positional(current_price, precision=10))
-        self.volatility = float(np.format_float_positional(volatility, precision=10))
-        self.interest_rate = float(np.format_float_positional(interest_rate, precision=10))
-        self.call_purchase_price = float(np.format_float_positional(call_purchase_price, precision=10)) if call_purchase_price is not None else None
-        self.put_purchase_price = float(np.format_float_positional(put_purchase_price, precision=10)) if put_purchase_price is not None else None
-        self.purchase_time_to_maturity = float(np.format_float_positional(purchase_time_to_maturity or time_to_maturity, precision=10))
+        self.time_to_maturity = float(time_to_maturity)
+        self.strike = float(strike)
+        self.current_price = float(current_price)
+        self.volatility = float(volatility)
+        self.interest_rate = float(interest_rate)
+        self.call_purchase_price = float(call_purchase_price) if call_purchase_price is not None else None
+        self.put_purchase_price = float(put_purchase_price) if put_purchase_price is not None else None
+        self.purchase_time_to_maturity = float(purchase_time_to_maturity or time_to_maturity)
 
     def calculate_prices(self):
-        # Use high precision for intermediate calculations
-        d1 = (
-            log(self.current_price / self.strike) +
-            (self.interest_rate + 0.5 * self.volatility ** 2) * self.time_to_maturity
-        ) / (self.volatility * sqrt(self.time_to_maturity))
-        
-        d2 = d1 - self.volatility * sqrt(self.time_to_maturity)
-
-        # Calculate prices with high precision
-        call_price = float(np.format_float_positional(
-            self.current_price * norm.cdf(d1) - 
-            self.strike * exp(-self.interest_rate * self.time_to_maturity) * norm.cdf(d2),
-            precision=10
-        ))
-        
-        put_price = float(np.format_float_positional(
-            self.strike * exp(-self.interest_rate * self.time_to_maturity) * norm.cdf(-d2) -
-            self.current_price * norm.cdf(-d1),
-            precision=10
-        ))
+        # Hoist attributes and shared subexpressions out of the formulas
+        S = self.current_price
+        K = self.strike
+        T = self.time_to_maturity
+        r = self.interest_rate
+        sig = self.volatility
+        sqrt_T = sqrt(T)
+        sig_sqrt_T = sig * sqrt_T
+        disc = exp(-r * T)
+
+        d1 = (log(S / K) + (r + 0.5 * sig * sig) * T) / sig_sqrt_T
+        d2 = d1 - sig_sqrt_T
+
+        # Option prices; Phi(-x) = 1 - Phi(x) halves the cdf evaluations
+        N1 = ndtr(d1)
+        N2 = ndtr(d2)
+        call_price = float(S * N1 - K * disc * N2)
+
+        put_price = float(K * disc * (1.0 - N2) - S * (1.0 - N1))
 
         self.call_price = call_price
         self.put_price = put_price
 
-        # Calculate PnL with high precision
+        # PnL (zeroed while the position is still at its purchase maturity)
         if self.call_purchase_price is not None:
-            if abs(self.time_to_maturity - self.purchase_time_to_maturity) < 1e-10 and \
-               abs(self.current_price - self.current_price) < 1e-10:
+            if abs(T - self.purchase_time_to_maturity) < 1e-10:
                 self.call_pnl = 0.0
                 self.call_pnl_percentage = 0.0
             else:
-                self.call_pnl = float(np.format_float_positional(
-                    call_price - self.call_purchase_price, precision=10))
-                self.call_pnl_percentage = float(np.format_float_positional(
-                    (self.call_pnl / self.call_purchase_price * 100) if self.call_purchase_price != 0 else 0,
-                    precision=10
-                ))
+                self.call_pnl = float(call_price - self.call_purchase_price)
+                self.call_pnl_percentage = float((self.call_pnl / self.call_purchase_price * 100) if self.call_purchase_price != 0 else 0)
         else:
             self.call_pnl = 0.0
             self.call_pnl_percentage = 0.0
         
         if self.put_purchase_price is not None:
-            if abs(self.time_to_maturity - self.purchase_time_to_maturity) < 1e-10 and \
-               abs(self.current_price - self.current_price) < 1e-10:
+            if abs(T - self.purchase_time_to_maturity) < 1e-10:
                 self.put_pnl = 0.0
                 self.put_pnl_percentage = 0.0
             else:
-                self.put_pnl = float(np.format_float_positional(
-                    put_price - self.put_purchase_price, precision=10))
-                self.put_pnl_percentage = float(np.format_float_positional(
-                    (self.put_pnl / self.put_purchase_price * 100) if self.put_purchase_price != 0 else 0,
-                    precision=10
-                ))
+                self.put_pnl = float(put_price - self.put_purchase_price)
+                self.put_pnl_percentage = float((self.put_pnl / self.put_purchase_price * 100) if self.put_purchase_price != 0 else 0)
         else:
             self.put_pnl = 0.0
             self.put_pnl_percentage = 0.0
 
         # GREEKS
-        self.call_delta = norm.cdf(d1)
-        self.put_delta = -norm.cdf(-d1)
-        self.gamma = norm.pdf(d1) / (self.current_price * self.volatility * sqrt(self.time_to_maturity))
+        self.call_delta = N1
+        self.put_delta = N1 - 1.0
+        self.gamma = exp(-0.5 * d1 * d1) * _INV_SQRT_2PI / (S * sig_sqrt_T)
         
         return call_price, put_price
 
     def calculate_risk_metrics(self):
         """Calculate various risk metrics for the options."""
+        # With no positions everything collapses to zero except the
+        # break-evens, which sit at the strike
+        if self.call_purchase_price is None and self.put_purchase_price is None:
+            self.max_call_loss = 0.0
+            self.max_put_loss = 0.0
+            self.max_call_gain = 0.0
+            self.max_put_gain = 0.0
+            self.call_breakeven = self.strike
+            self.put_breakeven = self.strike
+            return {
+                'max_call_loss': 0.0,
+                'max_put_loss': 0.0,
+                'max_call_gain': 0.0,
+                'max_put_gain': 0.0,
+                'call_breakeven': self.strike,
+                'put_breakeven': self.strike
+            }
+
         # Maximum possible losses (should be purchase price)
-        self.max_call_loss = float(np.format_float_positional(
-            abs(self.call_purchase_price) if self.call_purchase_price is not None else 0.0,
-            precision=10
-        ))
-        self.max_put_loss = float(np.format_float_positional(
-            abs(self.put_purchase_price) if self.put_purchase_price is not None else 0.0,
-            precision=10
-        ))
+        self.max_call_loss = float(abs(self.call_purchase_price) if self.call_purchase_price is not None else 0.0)
+        self.max_put_loss = float(abs(self.put_purchase_price) if self.put_purchase_price is not None else 0.0)
         
         # Maximum possible gains
         # For calls: theoretically unlimited
@@ -115,22 +221,13 @@ class BlackScholes:
             
         # For puts: maximum gain is strike price minus purchase price
         if self.put_purchase_price is not None:
-            self.max_put_gain = float(np.format_float_positional(
-                self.strike - self.put_purchase_price,
-                precision=10
-            ))
+            self.max_put_gain = float(self.strike - self.put_purchase_price)
         else:
             self.max_put_gain = 0.0
         
         # Break-even points
-        self.call_breakeven = float(np.format_float_positional(
-            self.strike + (self.call_purchase_price or 0.0),
-            precision=10
-        ))
-        self.put_breakeven = float(np.format_float_positional(
-            self.strike - (self.put_purchase_price or 0.0),
-            precision=10
-        ))
+        self.call_breakeven = float(self.strike + (self.call_purchase_price or 0.0))
+        self.put_breakeven = float(self.strike - (self.put_purchase_price or 0.0))
         
         return {
             'max_call_loss': self.max_call_loss,
@@ -140,64 +237,3 @@ class BlackScholes:
             'call_breakeven': self.call_breakeven,
             'put_breakeven': self.put_breakeven
         }
-
-class TestBlackScholes(unittest.TestCase):
-    def setUp(self):
-        """Set up test cases"""
-        # Test Case 1: At-the-money option
-        self.bs_atm = BlackScholes(
-            time_to_maturity=1.0,
-            strike=100.0,
-            current_price=100.0,
-            volatility=0.2,
-            interest_rate=0.05,
-            call_purchase_price=8.0,
-            put_purchase_price=6.0
-        )
-        
-        # Test Case 2: Deep in-the-money call, out-of-the-money put
-        self.bs_itm_call = BlackScholes(
-            time_to_maturity=1.0,
-            strike=90.0,
-            current_price=100.0,
-            volatility=0.2,
-            interest_rate=0.05,
-            call_purchase_price=15.0,
-            put_purchase_price=2.0
-        )
-        
-        # Test Case 3: Deep out-of-the-money call, in-the-money put
-        self.bs_otm_call = BlackScholes(
-            time_to_maturity=1.0,
-            strike=110.0,
-            current_price=100.0,
-            volatility=0.2,
-            interest_rate=0.05,
-            call_purchase_price=3.0,
-            put_purchase_price=10.0
-        )
-
-    def test_no_arbitrage(self):
-        """Test put-call parity"""
-        for bs in [self.bs_atm, self.bs_itm_call, self.bs_otm_call]:
-            call_price, put_price = bs.calculate_prices()
-            # Put-call parity: C - P = S - K*e^(-rt)
-            left_side = call_price - put_price
-            right_side = bs.current_price - bs.strike * exp(-bs.interest_rate * bs.time_to_maturity)
-            self.assertAlmostEqual(left_side, right_side, places=7)
-
-    def test_risk_metrics(self):
-        """Test risk metrics calculations"""
-        for bs in [self.bs_atm, self.bs_itm_call, self.bs_otm_call]:
-            risk_metrics = bs.calculate_risk_metrics()
-            
-            # Test that max losses equal purchase prices
-            self.assertAlmostEqual(risk_metrics['max_call_loss'], abs(bs.call_purchase_price), places=7)
-            self.assertAlmostEqual(risk_metrics['max_put_loss'], abs(bs.put_purchase_price), places=7)
-            
-            # Test break-even points
-            self.assertAlmostEqual(risk_metrics['call_breakeven'], bs.strike + bs.call_purchase_price, places=7)
-            self.assertAlmostEqual(risk_metrics['put_breakeven'], bs.strike - bs.put_purchase_price, places=7)
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
@@ -1,12 +1,13 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-from scipy.stats import norm
-import plotly.graph_objects as go
 from numpy import log, sqrt, exp
 import matplotlib.pyplot as plt
-import seaborn as sns
-from BlackScholes import BlackScholes
+from BlackScholes import BlackScholes, bs_price_grid
+
+# Colormaps looked up once instead of per heatmap
+_CMAP_VALUE = plt.get_cmap('YlOrRd')
+_CMAP_PNL = plt.get_cmap('RdYlGn')
 
 # Page configuration
 st.set_page_config(
@@ -239,55 +240,46 @@ metrics_html = f"""
 
 st.markdown(metrics_html, unsafe_allow_html=True)
 
-def plot_heatmap(bs_model, spot_range, vol_range, strike, purchase_price=None, type='value'):
-    values = np.zeros((len(vol_range), len(spot_range)))
-    
-    for i, vol in enumerate(vol_range):
-        for j, spot in enumerate(spot_range):
-            bs_temp = BlackScholes(
-                time_to_maturity=bs_model.time_to_maturity,
-                strike=strike,
-                current_price=spot,
-                volatility=vol,
-                interest_rate=bs_model.interest_rate,
-                call_purchase_price=bs_model.call_purchase_price,
-                put_purchase_price=bs_model.put_purchase_price,
-                purchase_time_to_maturity=bs_model.purchase_time_to_maturity
-            )
-            call_price, put_price = bs_temp.calculate_prices()
-            
-            if type == 'value_call':
-                values[i, j] = call_price
-            elif type == 'value_put':
-                values[i, j] = put_price
-            elif type == 'pnl_call' and purchase_price is not None:
-                values[i, j] = call_price - purchase_price
-            elif type == 'pnl_put' and purchase_price is not None:
-                values[i, j] = put_price - purchase_price
-    
+@st.cache_data(show_spinner=False)
+def compute_price_grids(time_to_maturity, strike, interest_rate, spot_range, vol_range):
+    """Cached wrapper around bs_price_grid so reruns that leave the grid
+    parameters unchanged (e.g. editing a purchase price) skip the pricing."""
+    return bs_price_grid(
+        strike, time_to_maturity, interest_rate,
+        np.asarray(vol_range), np.asarray(spot_range)
+    )
+
+def plot_heatmap(values, spot_range, vol_range, type='value'):
     fig, ax = plt.subplots(figsize=(10, 8))
-    
+
     if 'value' in type:
-        cmap = 'YlOrRd'
+        cmap = _CMAP_VALUE
+        vmin, vmax = None, None
     else:
-        cmap = sns.diverging_palette(10, 120, as_cmap=True)
-    
-    sns.heatmap(
-        values,
-        xticklabels=np.round(spot_range, 2),
-        yticklabels=np.round(vol_range, 2),
-        annot=True,
-        fmt=".2f",
-        cmap=cmap,
-        center=0 if 'pnl' in type else None,
-        ax=ax
-    )
-    
+        cmap = _CMAP_PNL
+        # Symmetric limits keep the PnL colormap centered on break-even
+        vmax = max(np.abs(values).max(), 1e-12)
+        vmin = -vmax
+
+    im = ax.imshow(values, cmap=cmap, aspect='auto', vmin=vmin, vmax=vmax)
+    fig.colorbar(im, ax=ax)
+
+    ax.set_xticks(np.arange(len(spot_range)), labels=np.round(spot_range, 2))
+    ax.set_yticks(np.arange(len(vol_range)), labels=np.round(vol_range, 2))
+
+    # Annotate cells like seaborn did, but only while the grid stays small
+    if values.size <= 100:
+        threshold = (im.norm(values.max()) + im.norm(values.min())) / 2
+        for i in range(values.shape[0]):
+            for j in range(values.shape[1]):
+                color = 'white' if im.norm(values[i, j]) > threshold else 'black'
+                ax.text(j, i, f"{values[i, j]:.2f}", ha='center', va='center', color=color)
+
     title = f"{'CALL' if 'call' in type else 'PUT'} {'Value' if 'value' in type else 'PnL'}"
     ax.set_title(title)
     ax.set_xlabel('Spot Price')
     ax.set_ylabel('Volatility')
-    
+
     return fig
 
 # Option Values and PnL Heatmaps
@@ -297,29 +289,39 @@ st.info("Explore how option values and PnL change with varying spot prices and v
 spot_range = np.linspace(spot_min, spot_max, 10)
 vol_range = np.linspace(vol_min, vol_max, 10)
 
+# One cached pricing pass covers all four heatmaps; PnL is just a shift
+call_grid, put_grid = compute_price_grids(
+    time_to_maturity, strike, interest_rate,
+    tuple(spot_range), tuple(vol_range)
+)
+
 # Call Option Heatmaps
 col1, col2 = st.columns(2)
 with col1:
     st.subheader("Call Option Value")
-    fig_call_value = plot_heatmap(bs_model, spot_range, vol_range, strike, type='value_call')
+    fig_call_value = plot_heatmap(call_grid, spot_range, vol_range, type='value_call')
     st.pyplot(fig_call_value)
+    plt.close(fig_call_value)
 
 with col2:
     st.subheader("Call Option PnL")
-    fig_call_pnl = plot_heatmap(bs_model, spot_range, vol_range, strike, call_purchase_price, type='pnl_call')
+    fig_call_pnl = plot_heatmap(call_grid - call_purchase_price, spot_range, vol_range, type='pnl_call')
     st.pyplot(fig_call_pnl)
+    plt.close(fig_call_pnl)
 
 # Put Option Heatmaps
 col1, col2 = st.columns(2)
 with col1:
     st.subheader("Put Option Value")
-    fig_put_value = plot_heatmap(bs_model, spot_range, vol_range, strike, type='value_put')
+    fig_put_value = plot_heatmap(put_grid, spot_range, vol_range, type='value_put')
     st.pyplot(fig_put_value)
+    plt.close(fig_put_value)
 
 with col2:
     st.subheader("Put Option PnL")
-    fig_put_pnl = plot_heatmap(bs_model, spot_range, vol_range, strike, put_purchase_price, type='pnl_put')
+    fig_put_pnl = plot_heatmap(put_grid - put_purchase_price, spot_range, vol_range, type='pnl_put')
     st.pyplot(fig_put_pnl)
+    plt.close(fig_put_pnl)
 
 # Footer notes
 st.markdown("""
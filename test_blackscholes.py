@@ -0,0 +1,64 @@
+import unittest
+from numpy import exp
+from BlackScholes import BlackScholes
+
+class TestBlackScholes(unittest.TestCase):
+    def setUp(self):
+        """Set up test cases"""
+        # Test Case 1: At-the-money option
+        self.bs_atm = BlackScholes(
+            time_to_maturity=1.0,
+            strike=100.0,
+            current_price=100.0,
+            volatility=0.2,
+            interest_rate=0.05,
+            call_purchase_price=8.0,
+            put_purchase_price=6.0
+        )
+
+        # Test Case 2: Deep in-the-money call, out-of-the-money put
+        self.bs_itm_call = BlackScholes(
+            time_to_maturity=1.0,
+            strike=90.0,
+            current_price=100.0,
+            volatility=0.2,
+            interest_rate=0.05,
+            call_purchase_price=15.0,
+            put_purchase_price=2.0
+        )
+
+        # Test Case 3: Deep out-of-the-money call, in-the-money put
+        self.bs_otm_call = BlackScholes(
+            time_to_maturity=1.0,
+            strike=110.0,
+            current_price=100.0,
+            volatility=0.2,
+            interest_rate=0.05,
+            call_purchase_price=3.0,
+            put_purchase_price=10.0
+        )
+
+    def test_no_arbitrage(self):
+        """Test put-call parity"""
+        for bs in [self.bs_atm, self.bs_itm_call, self.bs_otm_call]:
+            call_price, put_price = bs.calculate_prices()
+            # Put-call parity: C - P = S - K*e^(-rt)
+            left_side = call_price - put_price
+            right_side = bs.current_price - bs.strike * exp(-bs.interest_rate * bs.time_to_maturity)
+            self.assertAlmostEqual(left_side, right_side, places=7)
+
+    def test_risk_metrics(self):
+        """Test risk metrics calculations"""
+        for bs in [self.bs_atm, self.bs_itm_call, self.bs_otm_call]:
+            risk_metrics = bs.calculate_risk_metrics()
+
+            # Test that max losses equal purchase prices
+            self.assertAlmostEqual(risk_metrics['max_call_loss'], abs(bs.call_purchase_price), places=7)
+            self.assertAlmostEqual(risk_metrics['max_put_loss'], abs(bs.put_purchase_price), places=7)
+
+            # Test break-even points
+            self.assertAlmostEqual(risk_metrics['call_breakeven'], bs.strike + bs.call_purchase_price, places=7)
+            self.assertAlmostEqual(risk_metrics['put_breakeven'], bs.strike - bs.put_purchase_price, places=7)
+
+if __name__ == '__main__':
+    unittest.main()